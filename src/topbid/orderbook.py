@@ -1,52 +1,205 @@
 """ OrderBook """
 
+import asyncio
 import logging
-from typing import Union
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import Optional, Union
+from urllib.parse import urlsplit
 
-import request_boost
+import aiohttp
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    import json as orjson
 
 from topbid.scheduler import RepeatEvery
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger("topbid_orderbook")
 
+# Initial number of rows in the price/volume arrays; doubled when full.
+INITIAL_CAPACITY = 256
+
 
-class OrderBook:
+class OrderBook:  # pylint: disable=too-many-instance-attributes
     """Fetches exchange orderbook top bid/ask price and volume by pair"""
 
     def __init__(self) -> None:
-        self.orderbook_bids = {}  # {"binance-BTC/USDT": (20000.1, 0.0001)}
-        self.orderbook_asks = {}  # {"binance-BTC/USDT": (20000.2, 0.0002)}
+        self.orderbook_bids = {}  # {("binance", "BTC/USDT"): (20000.1, 0.0001)}
+        self.orderbook_asks = {}  # {("binance", "BTC/USDT"): (20000.2, 0.0002)}
+
+        # One keep-alive session per exchange host, created lazily.
+        # Reusing sockets across ticks avoids paying TCP+TLS handshakes
+        # on every update.
+        self._sessions = {}
+
+        # Per-pair poll plan: {_id: url}. The URL is static once a pair
+        # is added, so it is computed once instead of being rebuilt on
+        # every tick.
+        self._poll_plan = {}
+        self._chart_urls = {}
+
+        # Structure-of-arrays mirror of the bid/ask dicts: one float64 row
+        # per pair so cross-pair analytics run as vectorized NumPy ops.
+        self._row_of = {}
+        self._free_rows = []
+        self._bid_px = np.full(INITIAL_CAPACITY, np.nan)
+        self._bid_qty = np.full(INITIAL_CAPACITY, np.nan)
+        self._ask_px = np.full(INITIAL_CAPACITY, np.nan)
+        self._ask_qty = np.full(INITIAL_CAPACITY, np.nan)
+
+        # Event loop and shared aiohttp session for the asyncio backend.
+        self._loop = None
+        self._loop_thread = None
+        self._aiohttp_session = None
 
         self.thread = None
         self.running = False
 
-    def start(self, update_every: float):
-        """Starts the background API fetching task"""
+    def start(self, update_every: float, use_aiohttp: bool = False):
+        """
+        Starts the background API fetching task.
+        With `use_aiohttp`, requests are fanned out from a single event
+        loop and aiohttp session instead of a pool of worker threads,
+        which scales better with hundreds of tracked pairs.
+        """
         # Let's have each request timeout happening slightly before the next iteration.
         timeout = update_every - (update_every * 0.01)
-        self.thread = RepeatEvery(update_every, self._update, timeout=timeout)
+        if use_aiohttp:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(target=self._run_loop, daemon=True)
+            self._loop_thread.start()
+            self.thread = RepeatEvery(
+                update_every, self._run_async_update, timeout=timeout
+            )
+        else:
+            self.thread = RepeatEvery(update_every, self._update, timeout=timeout)
         self.thread.start()
         self.running = True
 
     def stop(self):
-        """Stops the background API fetching task"""
+        """
+        Stops the background API fetching task.
+        In-flight requests on the asyncio backend are cancelled rather
+        than awaited, so shutdown does not wait out their timeouts.
+        """
         self.running = False
         if self.thread:
             self.thread.stop()
-        self.orderbook_bids = {}
-        self.orderbook_asks = {}
+        if self._loop:
+            asyncio.run_coroutine_threadsafe(self._shutdown_async(), self._loop).result(
+                timeout=5
+            )
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=5)
+            self._loop = None
+            self._loop_thread = None
+        self._reset()
 
-    def _set_bid_price_and_volume(self, _id: str, price: float, volume: float) -> None:
+    async def _shutdown_async(self) -> None:
+        """Cancels in-flight updates and closes the aiohttp session"""
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        # wait for the cancellations to land so any future a scheduler
+        # tick is blocked on gets resolved before the loop stops
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._aiohttp_session:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+
+    def _run_loop(self) -> None:
+        # bind the loop once: stop() drops self._loop while this thread
+        # is still winding down
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def _run_async_update(self, timeout) -> None:
+        """Runs one async update from the scheduler thread"""
+        loop = self._loop
+        if not self.running or loop is None:
+            # stop() may race with a tick already scheduled
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._update_async(timeout), loop).result()
+        except (CancelledError, asyncio.CancelledError):
+            # stop() cancels in-flight updates for a fast shutdown; the
+            # cross-thread future raises the concurrent.futures flavor
+            pass
+
+    def _get_session(self, url: str) -> requests.Session:
+        """Returns the pooled keep-alive session for the URL's host"""
+        host = urlsplit(url).netloc
+        session = self._sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=32,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._sessions[host] = session
+        return session
+
+    def _fetch(self, url: str, timeout: float) -> Optional[bytes]:
+        """Fetches a single URL, returning the raw body or None on error"""
+        try:
+            response = self._get_session(url).get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.content
+        except requests.RequestException:
+            return None
+
+    def _assign_row(self, _id: tuple) -> int:
+        """Assigns a row in the price/volume arrays to a new pair"""
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = len(self._row_of)
+            if row >= len(self._bid_px):
+                self._grow_arrays()
+        self._row_of[_id] = row
+        return row
+
+    def _grow_arrays(self) -> None:
+        """Doubles the capacity of the price/volume arrays"""
+        extra = np.full(len(self._bid_px), np.nan)
+        self._bid_px = np.concatenate((self._bid_px, extra))
+        self._bid_qty = np.concatenate((self._bid_qty, extra))
+        self._ask_px = np.concatenate((self._ask_px, extra))
+        self._ask_qty = np.concatenate((self._ask_qty, extra))
+
+    def _set_bid_price_and_volume(
+        self, _id: tuple, price: float, volume: float
+    ) -> None:
         self.orderbook_bids[_id] = (price, volume)
+        row = self._row_of.get(_id)
+        if row is not None:
+            self._bid_px[row] = float(price)
+            self._bid_qty[row] = float(volume)
 
-    def _set_ask_price_and_volume(self, _id: str, price: float, volume: float) -> None:
+    def _set_ask_price_and_volume(
+        self, _id: tuple, price: float, volume: float
+    ) -> None:
         self.orderbook_asks[_id] = (price, volume)
+        row = self._row_of.get(_id)
+        if row is not None:
+            self._ask_px[row] = float(price)
+            self._ask_qty[row] = float(volume)
 
-    def _init_pair(self, _id: str, force=False) -> None:
+    def _init_pair(self, _id: tuple, force=False) -> None:
         """
         Initializes a pair with empty values.
         Called when adding a pair (but won't reset data if adding the same pair again)
@@ -55,133 +208,298 @@ class OrderBook:
         if _id not in self.orderbook_bids or _id not in self.orderbook_asks or force:
             self.orderbook_bids[_id] = (None, None)
             self.orderbook_asks[_id] = (None, None)
+            row = self._row_of.get(_id)
+            if row is None:
+                row = self._assign_row(_id)
+            self._bid_px[row] = self._bid_qty[row] = np.nan
+            self._ask_px[row] = self._ask_qty[row] = np.nan
+        if _id not in self._poll_plan:
+            self._poll_plan[_id] = self.get_orderbook_url(*_id)
 
     def _reset(self) -> None:
         """Empty all saved pair prices"""
         self.orderbook_bids = {}
         self.orderbook_asks = {}
+        self._poll_plan = {}
+        self._row_of = {}
+        self._free_rows = []
+        self._bid_px = np.full(INITIAL_CAPACITY, np.nan)
+        self._bid_qty = np.full(INITIAL_CAPACITY, np.nan)
+        self._ask_px = np.full(INITIAL_CAPACITY, np.nan)
+        self._ask_qty = np.full(INITIAL_CAPACITY, np.nan)
 
     def delete(self, exchange_name: str, pair: str) -> None:
         """
         Removes volume and price for a specific exchange/pair couple.
         Can be used when a trade has just been closed for cleanup.
         """
-        _id = f"{exchange_name.lower()}-{pair}"
-        self.orderbook_bids.pop(_id, None)
+        _id = (exchange_name.lower(), pair)
+        if self.orderbook_bids.pop(_id, None) is None:
+            # unknown pair: the other structures are kept in lockstep,
+            # so there is nothing else to clean up
+            return
         self.orderbook_asks.pop(_id, None)
+        self._poll_plan.pop(_id, None)
+        row = self._row_of.pop(_id, None)
+        if row is not None:
+            self._bid_px[row] = self._bid_qty[row] = np.nan
+            self._ask_px[row] = self._ask_qty[row] = np.nan
+            self._free_rows.append(row)
 
     def add(self, exchange_name: str, pairs: Union[str, list]):
         """Adds specific exchange/pair(s) to get prices of"""
         if not isinstance(pairs, list):
             pairs = [pairs]
+        self.add_bulk(exchange_name, pairs)
+
+    def add_bulk(self, exchange_name: str, pairs: list) -> None:
+        """
+        Adds many pairs from a single exchange, resolving the exchange
+        URL spec once instead of once per pair.
+        """
+        exchange_name = exchange_name.lower()
+        spec = _ORDERBOOK_URL_SPECS.get(exchange_name)
+        if spec is None:
+            raise RuntimeError(f"{exchange_name=} not supported")
+        separator, case, template = spec
         for pair in pairs:
             # Initialize pair (if not already added)
-            _id = f"{exchange_name.lower()}-{pair}"
+            _id = (exchange_name, pair)
+            if _id not in self._poll_plan:
+                self._poll_plan[_id] = template.format(
+                    symbol=case(pair).replace("/", separator)
+                )
             self._init_pair(_id)
 
+    def _build_fetch_plan(self) -> list:
+        """
+        Builds the list of (ids, url) couples to fetch on this tick.
+        Pairs tracked on exchanges with a batched top-of-book endpoint
+        (currently Binance) are collapsed into a single request.
+        """
+        by_exchange = {}
+        for _id, url in self._poll_plan.items():
+            by_exchange.setdefault(_id[0], []).append((_id, url))
+
+        plan = []
+        for exchange_name, entries in by_exchange.items():
+            if exchange_name == "binance" and len(entries) > 1:
+                symbols = ",".join(
+                    f'"{pair.replace("/", "").upper()}"' for (_, pair), _ in entries
+                )
+                url = f"https://api.binance.com/api/v3/ticker/bookTicker?symbols=[{symbols}]"
+                plan.append(([_id for _id, _ in entries], url))
+                continue
+            for _id, url in entries:
+                plan.append(([_id], url))
+        return plan
+
+    def _parse_binance_batch(self, ids: list, res: list) -> None:
+        """Maps a batched Binance bookTicker response back to tracked pairs"""
+        by_symbol = {}
+        for _id in ids:
+            by_symbol[_id[1].replace("/", "").upper()] = _id
+        for entry in res:
+            _id = by_symbol.pop(entry["symbol"], None)
+            if _id is None:
+                continue
+            self._set_bid_price_and_volume(
+                _id, float(entry["bidPrice"]), float(entry["bidQty"])
+            )
+            self._set_ask_price_and_volume(
+                _id, float(entry["askPrice"]), float(entry["askQty"])
+            )
+        # cleanup stale data for pairs missing from the response
+        for _id in by_symbol.values():
+            self._init_pair(_id, force=True)
+
     def _update(self, timeout) -> None:
         """Updates the orderbook with pair top ask/bid prices and volumes"""
         if not self.running:
             return
+        if not self._poll_plan:
+            # nothing tracked yet, skip the executor setup entirely
+            return
 
-        urls = []
-        ids = list(self.orderbook_bids.keys())  # Get all initialized pairs
-        for _id in ids:
-            exchange_name, pair = _id.split("-")
-            urls.append(self.get_orderbook_url(exchange_name, pair))
-
-        responses = request_boost.boosted_requests(
-            urls,
-            max_tries=1,
-            timeout=timeout,
-            verbose=False,
-            parse_json=True,
-        )
+        plan = self._build_fetch_plan()
 
-        for _id, res in zip(ids, responses):
-            if res is None:
-                exchange_name, pair = _id.split("-")
-                logger.warning(
-                    "update orderbook: request error or timeout for %s",
-                    f"{pair} ({exchange_name})",
+        with ThreadPoolExecutor(max_workers=len(plan)) as executor:
+            responses = list(
+                executor.map(lambda entry: self._fetch(entry[1], timeout), plan)
+            )
+
+        self._dispatch_responses(plan, responses)
+
+    async def _update_async(self, timeout) -> None:
+        """Async variant of _update sharing one aiohttp session across ticks"""
+        if not self.running:
+            return
+
+        if not self._poll_plan:
+            # nothing tracked yet, skip the fan-out entirely
+            return
+
+        if self._aiohttp_session is None:
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
                 )
-                # cleanup stale data
-                self._init_pair(_id, force=True)
-                continue
+            )
 
-            # this may need a bit of improvement but for now conditions order matters
-            # to avoid matching wrong exchange with similar keys
-            if all(k in res for k in ("code", "msg", "data", "ts")):  # okx
-                if res["code"] == "0":
-                    self._set_bid_price_and_volume(
-                        _id,
-                        float(res["data"][0]["bids"][0][0]),
-                        float(res["data"][0]["bids"][0][1]),
-                    )
-                    self._set_ask_price_and_volume(
-                        _id,
-                        float(res["data"][0]["asks"][0][0]),
-                        float(res["data"][0]["asks"][0][1]),
+        plan = self._build_fetch_plan()
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        responses = await asyncio.gather(
+            *[self._fetch_async(url, client_timeout) for _, url in plan]
+        )
+        self._dispatch_responses(plan, responses)
+
+    async def _fetch_async(self, url: str, timeout) -> Optional[bytes]:
+        """Fetches a single URL asynchronously, returning None on error"""
+        session = self._aiohttp_session
+        if session is None:  # stop() may race with an in-flight tick
+            return None
+        try:
+            # pylint: disable-next=not-async-context-manager
+            async with session.get(url, timeout=timeout) as response:
+                response.raise_for_status()
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+    def _dispatch_responses(  # pylint: disable=too-many-locals
+        self, plan: list, responses: list
+    ) -> None:
+        """Parses raw responses and updates the tracked pairs"""
+        # Bind hot attributes once: the loop below runs for every tracked
+        # pair on every tick and LOAD_ATTR is not free in CPython.
+        loads = orjson.loads
+        init_pair = self._init_pair
+        parsers = self._PARSERS_BY_EXCHANGE
+        log_warning = logger.warning
+
+        for (ids, _), res in zip(plan, responses):
+            if res is not None:
+                # orjson is much faster than stdlib json at decoding the
+                # number-heavy orderbook payloads returned by exchanges
+                res = loads(res)
+            if res is None:
+                for _id in ids:
+                    exchange_name, pair = _id
+                    log_warning(
+                        "update orderbook: request error or timeout for %s (%s)",
+                        pair,
+                        exchange_name,
                     )
+                    # cleanup stale data
+                    init_pair(_id, force=True)
                 continue
-            if all(k in res for k in ("data", "code")):  # kucoin
-                if res["code"] == "200000":
-                    if res["data"]["bids"] is not None:
-                        self._set_bid_price_and_volume(
-                            _id, res["data"]["bids"][0][0], res["data"]["bids"][0][1]
-                        )
-                    if res["data"]["bids"] is not None:
-                        self._set_ask_price_and_volume(
-                            _id, res["data"]["asks"][0][0], res["data"]["asks"][0][1]
-                        )
-                continue
-            if all(k in res for k in ("bids", "asks", "lastUpdateId")):  # binance
-                self._set_bid_price_and_volume(
-                    _id, res["bids"][0][0], res["bids"][0][1]
-                )
-                self._set_ask_price_and_volume(
-                    _id, res["asks"][0][0], res["asks"][0][1]
-                )
-                continue
-            if all(k in res for k in ("result", "retCode", "retMsg", "time")):  # bybit
-                if res["retCode"] == 0:
-                    self._set_bid_price_and_volume(
-                        _id,
-                        float(res["result"]["b"][0][0]),
-                        float(res["result"]["b"][0][1]),
-                    )
-                    self._set_ask_price_and_volume(
-                        _id,
-                        float(res["result"]["a"][0][0]),
-                        float(res["result"]["a"][0][1]),
-                    )
+
+            if len(ids) > 1:  # batched binance response
+                self._parse_binance_batch(ids, res)
                 continue
-            if all(k in res for k in ("bids", "asks", "current", "update")):  # gateio
-                self._set_bid_price_and_volume(
-                    _id, res["bids"][0][0], res["bids"][0][1]
-                )
-                self._set_ask_price_and_volume(
-                    _id, res["asks"][0][0], res["asks"][0][1]
+
+            _id = ids[0]
+
+            # The exchange is already known from the id, so routing is a
+            # single dict hit rather than probing response signatures.
+            parser = parsers[_id[0]]
+            try:
+                parser(self, _id, res)
+            except (KeyError, IndexError, TypeError, ValueError):
+                # a malformed payload must not starve the rest of the tick
+                log_warning(
+                    "update orderbook: bad response, not matching %s format", _id[0]
                 )
-                continue
-            if all(k in res for k in ("result", "error")):  # kraken
-                key = next(iter(res["result"]))
+                init_pair(_id, force=True)
+
+    def _parse_okx(self, _id: tuple, res: dict) -> None:
+        if res["code"] == "0":
+            self._set_bid_price_and_volume(
+                _id,
+                float(res["data"][0]["bids"][0][0]),
+                float(res["data"][0]["bids"][0][1]),
+            )
+            self._set_ask_price_and_volume(
+                _id,
+                float(res["data"][0]["asks"][0][0]),
+                float(res["data"][0]["asks"][0][1]),
+            )
+
+    def _parse_kucoin(self, _id: tuple, res: dict) -> None:
+        if res["code"] == "200000":
+            data = res["data"]
+            bids = data["bids"]
+            asks = data["asks"]
+            if bids:
                 self._set_bid_price_and_volume(
-                    _id,
-                    res["result"][key]["bids"][0][0],
-                    res["result"][key]["bids"][0][1],
+                    _id, float(bids[0][0]), float(bids[0][1])
                 )
+            if asks:
                 self._set_ask_price_and_volume(
-                    _id,
-                    res["result"][key]["asks"][0][0],
-                    res["result"][key]["asks"][0][1],
+                    _id, float(asks[0][0]), float(asks[0][1])
                 )
-                continue
 
-            # if no case matched the exchange API response format, throw a warning
+    def _parse_binance(self, _id: tuple, res: dict) -> None:
+        self._set_bid_price_and_volume(
+            _id, float(res["bids"][0][0]), float(res["bids"][0][1])
+        )
+        self._set_ask_price_and_volume(
+            _id, float(res["asks"][0][0]), float(res["asks"][0][1])
+        )
+
+    def _parse_bybit(self, _id: tuple, res: dict) -> None:
+        if res["retCode"] == 0:
+            self._set_bid_price_and_volume(
+                _id,
+                float(res["result"]["b"][0][0]),
+                float(res["result"]["b"][0][1]),
+            )
+            self._set_ask_price_and_volume(
+                _id,
+                float(res["result"]["a"][0][0]),
+                float(res["result"]["a"][0][1]),
+            )
+
+    def _parse_gateio(self, _id: tuple, res: dict) -> None:
+        self._set_bid_price_and_volume(
+            _id, float(res["bids"][0][0]), float(res["bids"][0][1])
+        )
+        self._set_ask_price_and_volume(
+            _id, float(res["asks"][0][0]), float(res["asks"][0][1])
+        )
+
+    def _parse_kraken(self, _id: tuple, res: dict) -> None:
+        # Kraken answers HTTP 200 with an error list and no result on
+        # unknown pairs or rate limits
+        if res.get("error") or "result" not in res:
             logger.warning(
-                "update orderbook: bad response, not matching any exchange format"
+                "update orderbook: error from Kraken API for %s: %s",
+                _id[1],
+                res.get("error"),
             )
+            self._init_pair(_id, force=True)
+            return
+        # the result is keyed by Kraken's own pair name, unknown upfront
+        inner = next(iter(res["result"].values()))
+        top_bid = inner["bids"][0]
+        top_ask = inner["asks"][0]
+        self._set_bid_price_and_volume(_id, float(top_bid[0]), float(top_bid[1]))
+        self._set_ask_price_and_volume(_id, float(top_ask[0]), float(top_ask[1]))
+
+    # Response routing by exchange name, resolved from the pair id in one
+    # dict hit per response.
+    _PARSERS_BY_EXCHANGE = {
+        "binance": _parse_binance,
+        "bybit": _parse_bybit,
+        "gateio": _parse_gateio,
+        "kraken": _parse_kraken,
+        "kucoin": _parse_kucoin,
+        "okex": _parse_okx,
+        "okx": _parse_okx,
+    }
 
     def get_orderbook_top_bid(self, exchange_name: str, pair: str) -> tuple:
         """
@@ -189,7 +507,7 @@ class OrderBook:
         Values can be `None` if no data is available yet.
         """
         price, volume = self.orderbook_bids.get(
-            f"{exchange_name.lower()}-{pair}", (None, None)
+            (exchange_name.lower(), pair), (None, None)
         )
         return price, volume
 
@@ -199,45 +517,117 @@ class OrderBook:
         Values can be `None` if no data is available yet.
         """
         price, volume = self.orderbook_asks.get(
-            f"{exchange_name.lower()}-{pair}", (None, None)
+            (exchange_name.lower(), pair), (None, None)
         )
         return price, volume
 
+    def _rows(self) -> np.ndarray:
+        """Returns the array rows of all tracked pairs"""
+        return np.fromiter(
+            self._row_of.values(), dtype=np.intp, count=len(self._row_of)
+        )
+
+    def spreads(self) -> dict:
+        """
+        Returns the ask-bid spread of every tracked pair, computed in one
+        vectorized operation. Spread is NaN while a pair has no data yet.
+        """
+        rows = self._rows()
+        return dict(zip(self._row_of, (self._ask_px[rows] - self._bid_px[rows])))
+
+    def mid_prices(self) -> dict:
+        """
+        Returns the bid/ask mid-price of every tracked pair, computed in
+        one vectorized operation. NaN while a pair has no data yet.
+        """
+        rows = self._rows()
+        return dict(zip(self._row_of, (self._bid_px[rows] + self._ask_px[rows]) * 0.5))
+
+    def best_bid_across(self) -> tuple:
+        """
+        Returns (pair id, price) of the highest bid across all tracked
+        pairs, or (None, None) when no data is available yet.
+        """
+        if not self._row_of:
+            return (None, None)
+        prices = self._bid_px[self._rows()]
+        if np.isnan(prices).all():
+            return (None, None)
+        best = int(np.nanargmax(prices))
+        return list(self._row_of)[best], float(prices[best])
+
     def get_orderbook_url(self, exchange_name: str, pair: str) -> str:
         """
         Helper generating URLs to exchange top orderbook APIs.
         """
-        if exchange_name == "binance":
-            return f"https://api.binance.com/api/v3/depth?limit=1&symbol={pair.replace('/', '')}"
-        if exchange_name == "bybit":
-            return f"https://api.bybit.com/v5/market/orderbook?category=spot&symbol={pair.upper().replace('/', '')}"
-        if exchange_name == "gateio":
-            return f"https://api.gateio.ws/api/v4/spot/order_book?currency_pair={pair.replace('/', '_')}"
-        if exchange_name == "kraken":
-            return f"https://api.kraken.com/0/public/Depth?count=1&pair={pair.replace('/', '')}"
-        if exchange_name == "kucoin":
-            return f"https://api.kucoin.com/api/v1/market/orderbook/level2_20?symbol={pair.replace('/', '-')}"
-        if exchange_name in ["okx", "okex"]:
-            return f"https://www.okx.com/api/v5/market/books?instId={pair.upper().replace('/', '-')}"
-        raise RuntimeError(f"{exchange_name=} not supported")
+        spec = _ORDERBOOK_URL_SPECS.get(exchange_name.lower())
+        if spec is None:
+            raise RuntimeError(f"{exchange_name=} not supported")
+        separator, case, template = spec
+        return template.format(symbol=case(pair).replace("/", separator))
 
     def get_chart_url(self, exchange_name: str, pair: str) -> str:
         """
         Helper generating URLs to used exchange trade charts.
+        Results are memoized, inputs being static for a given couple.
         """
         exchange_name = exchange_name.lower()
-        if exchange_name == "binance":
-            return (
-                f"[{pair}](https://www.binance.com/en/trade/{pair.replace('/', '_')})"
+        cached = self._chart_urls.get((exchange_name, pair))
+        if cached is None:
+            spec = _CHART_URL_SPECS.get(exchange_name)
+            if spec is None:
+                raise RuntimeError(f"{exchange_name=} not supported")
+            separator, case, template = spec
+            cached = template.format(
+                pair=pair, symbol=case(pair).replace("/", separator)
             )
-        if exchange_name == "bybit":
-            return f"[{pair}](https://www.bybit.com/en-US/trade/spot/{pair.upper()})"
-        if exchange_name == "gateio":
-            return f"[{pair}](https://www.gate.io/trade/{pair.replace('/', '_')})"
-        if exchange_name == "kraken":
-            return f"[{pair}](https://pro.kraken.com/app/trade/{pair.lower().replace('/', '-')})"
-        if exchange_name == "kucoin":
-            return f"[{pair}](https://www.kucoin.com/trade/{pair.replace('/', '-')})"
-        if exchange_name in ["okx", "okex"]:
-            return f"[{pair}](https://www.okx.com/trade-spot/{pair.lower().replace('/', '-')})"
-        raise RuntimeError(f"{exchange_name=} not supported")
+            self._chart_urls[(exchange_name, pair)] = cached
+        return cached
+
+
+# Exchange URL specs: (pair separator, case transform, URL template).
+# The symbol slot receives the pair with its case transform applied and
+# "/" swapped for the separator.
+_ORDERBOOK_URL_SPECS = {
+    "binance": (
+        "",
+        str,
+        "https://api.binance.com/api/v3/depth?limit=1&symbol={symbol}",
+    ),
+    "bybit": (
+        "",
+        str.upper,
+        "https://api.bybit.com/v5/market/orderbook?category=spot&limit=1&symbol={symbol}",
+    ),
+    "gateio": (
+        "_",
+        str,
+        "https://api.gateio.ws/api/v4/spot/order_book?limit=1&currency_pair={symbol}",
+    ),
+    "kraken": ("", str, "https://api.kraken.com/0/public/Depth?count=1&pair={symbol}"),
+    "kucoin": (
+        "-",
+        str,
+        "https://api.kucoin.com/api/v1/market/orderbook/level2_5?symbol={symbol}",
+    ),
+    "okx": (
+        "-",
+        str.upper,
+        "https://www.okx.com/api/v5/market/books?sz=1&instId={symbol}",
+    ),
+}
+_ORDERBOOK_URL_SPECS["okex"] = _ORDERBOOK_URL_SPECS["okx"]
+
+_CHART_URL_SPECS = {
+    "binance": ("_", str, "[{pair}](https://www.binance.com/en/trade/{symbol})"),
+    "bybit": (
+        "/",
+        str.upper,
+        "[{pair}](https://www.bybit.com/en-US/trade/spot/{symbol})",
+    ),
+    "gateio": ("_", str, "[{pair}](https://www.gate.io/trade/{symbol})"),
+    "kraken": ("-", str.lower, "[{pair}](https://pro.kraken.com/app/trade/{symbol})"),
+    "kucoin": ("-", str, "[{pair}](https://www.kucoin.com/trade/{symbol})"),
+    "okx": ("-", str.lower, "[{pair}](https://www.okx.com/trade-spot/{symbol})"),
+}
+_CHART_URL_SPECS["okex"] = _CHART_URL_SPECS["okx"]
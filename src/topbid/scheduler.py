@@ -5,10 +5,6 @@ import threading
 import time
 from collections.abc import Callable
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger("topbid_scheduler")
 
 
@@ -25,13 +21,24 @@ class RepeatEvery(threading.Thread):
 
     def run(self):
         """Starts the scheduler"""
+        # Sleeping beforehand, letting time for dependencies to startup.
+        # Ticks then follow a monotonic deadline schedule so the period
+        # stays `interval` regardless of how long each call takes.
+        next_tick = time.monotonic() + self.interval
         while self.runable:
-            # Sleeping beforehand, letting time for dependencies to startup
-            time.sleep(self.interval)
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+            if not self.runable:
+                break
             try:
                 self.func(*self.args, **self.kwargs)
             except Exception as exc:  # pylint: disable=broad-except
                 logger.exception(exc)
+            next_tick += self.interval
+            # When a call overruns, skip the missed ticks instead of
+            # firing a catch-up burst.
+            now = time.monotonic()
+            while next_tick <= now:
+                next_tick += self.interval
 
     def stop(self):
         """Stops the scheduler"""
@@ -0,0 +1,316 @@
+""" WebSocket OrderBook """
+
+import asyncio
+import logging
+import threading
+import time
+
+import websockets
+
+# Share the orderbook module's JSON backend (orjson with stdlib fallback)
+from topbid.orderbook import OrderBook, orjson
+
+logger = logging.getLogger("topbid_websocket")
+
+# Reconnect delay after a dropped or failed connection (seconds)
+RECONNECT_DELAY = 1
+# Send an application-level ping after this much receive inactivity (seconds)
+PING_IDLE_TIMEOUT = 15
+# Exchange names sharing another exchange's stream implementation
+STREAM_ALIASES = {"okex": "okx"}
+
+
+def _dumps(payload) -> str:
+    """Serializes a subscribe/ping payload to a text frame"""
+    data = orjson.dumps(payload)
+    return data.decode() if isinstance(data, bytes) else data
+
+
+class OrderBookWS(OrderBook):
+    """
+    Drop-in alternative to `OrderBook` fed by exchange WebSocket streams.
+
+    Instead of polling REST APIs on an interval, one background task per
+    exchange subscribes to its top-of-book push feed and writes every
+    update straight into the orderbook. Latency drops from seconds to
+    milliseconds and no HTTP request is made after the subscription.
+
+    Supports Binance, Bybit, Gateio, Kraken, Kucoin and OKX.
+    """
+
+    def start(self, update_every: float = 0.0, use_aiohttp: bool = False):
+        """
+        Starts the background WebSocket subscription tasks.
+        Both arguments are unused: updates are pushed by the exchanges.
+        """
+        by_exchange = {}
+        for _id in self.orderbook_bids:
+            exchange_name, pair = _id
+            by_exchange.setdefault(exchange_name, []).append(pair)
+
+        for exchange_name in by_exchange:
+            stream_name = STREAM_ALIASES.get(exchange_name, exchange_name)
+            if not hasattr(self, f"_stream_{stream_name}"):
+                raise RuntimeError(f"{exchange_name=} not supported")
+
+        self.running = True
+        self._loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread.start()
+        for exchange_name, pairs in by_exchange.items():
+            asyncio.run_coroutine_threadsafe(
+                self._watch(exchange_name, pairs), self._loop
+            )
+
+    def stop(self):
+        """Stops the background WebSocket subscription tasks"""
+        self.running = False
+        if self._loop:
+            # cancel and await the stream tasks before stopping the loop
+            asyncio.run_coroutine_threadsafe(self._shutdown_async(), self._loop).result(
+                timeout=5
+            )
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+        if self.thread:
+            self.thread.join(timeout=5)
+            self.thread = None
+        self._reset()
+
+    async def _watch(self, exchange_name: str, pairs: list) -> None:
+        """Runs an exchange stream forever, reconnecting on failure"""
+        stream_name = STREAM_ALIASES.get(exchange_name, exchange_name)
+        stream = getattr(self, f"_stream_{stream_name}")
+        while self.running:
+            try:
+                await stream(exchange_name, pairs)
+            except asyncio.CancelledError:
+                return
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning("websocket stream error for %s: %s", exchange_name, exc)
+            if self.running:
+                await asyncio.sleep(RECONNECT_DELAY)
+
+    @staticmethod
+    async def _recv_or_ping(websocket, ping_payload, timeout=PING_IDLE_TIMEOUT):
+        """
+        Waits for the next frame, sending an application-level ping
+        when the connection has been idle for `timeout` seconds.
+        Returns None when a ping was sent instead of a frame received.
+        """
+        try:
+            return await asyncio.wait_for(websocket.recv(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await websocket.send(ping_payload)
+            return None
+
+    async def _stream_binance(self, exchange_name: str, pairs: list) -> None:
+        """Binance bookTicker stream: wss://stream.binance.com"""
+        by_symbol = {
+            pair.replace("/", "").upper(): (exchange_name, pair) for pair in pairs
+        }
+        streams = "/".join(
+            f"{pair.replace('/', '').lower()}@bookTicker" for pair in pairs
+        )
+        url = f"wss://stream.binance.com:9443/stream?streams={streams}"
+        async with websockets.connect(url) as websocket:
+            while self.running:
+                message = await websocket.recv()
+                data = orjson.loads(message).get("data")
+                if data is None:
+                    continue
+                _id = by_symbol.get(data["s"])
+                if _id is None:
+                    continue
+                self._set_bid_price_and_volume(_id, float(data["b"]), float(data["B"]))
+                self._set_ask_price_and_volume(_id, float(data["a"]), float(data["A"]))
+
+    async def _stream_bybit(self, exchange_name: str, pairs: list) -> None:
+        """Bybit spot orderbook.1 stream: wss://stream.bybit.com"""
+        by_symbol = {
+            pair.replace("/", "").upper(): (exchange_name, pair) for pair in pairs
+        }
+        url = "wss://stream.bybit.com/v5/public/spot"
+        async with websockets.connect(url) as websocket:
+            await websocket.send(
+                _dumps(
+                    {"op": "subscribe", "args": [f"orderbook.1.{s}" for s in by_symbol]}
+                )
+            )
+            while self.running:
+                message = await self._recv_or_ping(websocket, _dumps({"op": "ping"}))
+                if message is None:
+                    continue
+                res = orjson.loads(message)
+                data = res.get("data")
+                if data is None:
+                    continue
+                _id = by_symbol.get(data.get("s"))
+                if _id is None:
+                    continue
+                # deltas may carry only one side of the book
+                if data["b"]:
+                    self._set_bid_price_and_volume(
+                        _id, float(data["b"][0][0]), float(data["b"][0][1])
+                    )
+                if data["a"]:
+                    self._set_ask_price_and_volume(
+                        _id, float(data["a"][0][0]), float(data["a"][0][1])
+                    )
+
+    async def _stream_gateio(self, exchange_name: str, pairs: list) -> None:
+        """Gate.io spot.book_ticker stream: wss://api.gateio.ws"""
+        by_symbol = {pair.replace("/", "_"): (exchange_name, pair) for pair in pairs}
+        url = "wss://api.gateio.ws/ws/v4/"
+        async with websockets.connect(url) as websocket:
+            await websocket.send(
+                _dumps(
+                    {
+                        "time": int(time.time()),
+                        "channel": "spot.book_ticker",
+                        "event": "subscribe",
+                        "payload": list(by_symbol),
+                    }
+                )
+            )
+            while self.running:
+                message = await self._recv_or_ping(
+                    websocket,
+                    _dumps({"time": int(time.time()), "channel": "spot.ping"}),
+                )
+                if message is None:
+                    continue
+                res = orjson.loads(message)
+                if res.get("event") != "update" or "result" not in res:
+                    continue
+                result = res["result"]
+                _id = by_symbol.get(result.get("s"))
+                if _id is None:
+                    continue
+                self._set_bid_price_and_volume(
+                    _id, float(result["b"]), float(result["B"])
+                )
+                self._set_ask_price_and_volume(
+                    _id, float(result["a"]), float(result["A"])
+                )
+
+    async def _stream_kraken(self, exchange_name: str, pairs: list) -> None:
+        """Kraken ticker stream: wss://ws.kraken.com"""
+        by_symbol = {pair.upper(): (exchange_name, pair) for pair in pairs}
+        url = "wss://ws.kraken.com"
+        async with websockets.connect(url) as websocket:
+            await websocket.send(
+                _dumps(
+                    {
+                        "event": "subscribe",
+                        "pair": list(by_symbol),
+                        "subscription": {"name": "ticker"},
+                    }
+                )
+            )
+            while self.running:
+                message = await self._recv_or_ping(websocket, _dumps({"event": "ping"}))
+                if message is None:
+                    continue
+                res = orjson.loads(message)
+                # data frames are arrays; events and heartbeats are objects
+                if not isinstance(res, list) or len(res) < 4:
+                    continue
+                _id = by_symbol.get(res[-1])
+                if _id is None:
+                    continue
+                data = res[1]
+                # ticker bid/ask arrays are (price, whole lot volume, lot volume)
+                self._set_bid_price_and_volume(
+                    _id, float(data["b"][0]), float(data["b"][2])
+                )
+                self._set_ask_price_and_volume(
+                    _id, float(data["a"][0]), float(data["a"][2])
+                )
+
+    async def _stream_kucoin(self, exchange_name: str, pairs: list) -> None:
+        """Kucoin level2Depth5 stream (token negotiated over REST)"""
+        by_symbol = {pair.replace("/", "-"): (exchange_name, pair) for pair in pairs}
+        loop = asyncio.get_running_loop()
+        url, ping_interval = await loop.run_in_executor(None, self._kucoin_ws_endpoint)
+        async with websockets.connect(url) as websocket:
+            await websocket.send(
+                _dumps(
+                    {
+                        "id": 1,
+                        "type": "subscribe",
+                        "topic": f"/spotMarket/level2Depth5:{','.join(by_symbol)}",
+                        "response": True,
+                    }
+                )
+            )
+            while self.running:
+                message = await self._recv_or_ping(
+                    websocket,
+                    _dumps({"id": 2, "type": "ping"}),
+                    timeout=ping_interval,
+                )
+                if message is None:
+                    continue
+                res = orjson.loads(message)
+                if res.get("type") != "message":
+                    continue
+                _id = by_symbol.get(res["topic"].rsplit(":", 1)[-1])
+                if _id is None:
+                    continue
+                data = res["data"]
+                if data["bids"]:
+                    self._set_bid_price_and_volume(
+                        _id, float(data["bids"][0][0]), float(data["bids"][0][1])
+                    )
+                if data["asks"]:
+                    self._set_ask_price_and_volume(
+                        _id, float(data["asks"][0][0]), float(data["asks"][0][1])
+                    )
+
+    def _kucoin_ws_endpoint(self) -> tuple:
+        """Negotiates the Kucoin WebSocket endpoint, token and ping interval"""
+        url = "https://api.kucoin.com/api/v1/bullet-public"
+        response = self._get_session(url).post(url, timeout=10)
+        response.raise_for_status()
+        data = orjson.loads(response.content)["data"]
+        server = data["instanceServers"][0]
+        return f"{server['endpoint']}?token={data['token']}", (
+            server["pingInterval"] / 1000
+        )
+
+    async def _stream_okx(self, exchange_name: str, pairs: list) -> None:
+        """OKX books5 stream: wss://ws.okx.com"""
+        by_symbol = {
+            pair.upper().replace("/", "-"): (exchange_name, pair) for pair in pairs
+        }
+        url = "wss://ws.okx.com:8443/ws/v5/public"
+        async with websockets.connect(url) as websocket:
+            await websocket.send(
+                _dumps(
+                    {
+                        "op": "subscribe",
+                        "args": [{"channel": "books5", "instId": s} for s in by_symbol],
+                    }
+                )
+            )
+            while self.running:
+                message = await self._recv_or_ping(websocket, "ping")
+                if message is None or message == "pong":
+                    continue
+                res = orjson.loads(message)
+                data = res.get("data")
+                if data is None:
+                    continue
+                _id = by_symbol.get(res["arg"]["instId"])
+                if _id is None:
+                    continue
+                book = data[0]
+                if book["bids"]:
+                    self._set_bid_price_and_volume(
+                        _id, float(book["bids"][0][0]), float(book["bids"][0][1])
+                    )
+                if book["asks"]:
+                    self._set_ask_price_and_volume(
+                        _id, float(book["asks"][0][0]), float(book["asks"][0][1])
+                    )
@@ -1,7 +1,6 @@
 """ Tests for main OrderBook class """
 
 import time
-from unittest.mock import patch
 
 import pytest
 import responses
@@ -12,17 +11,15 @@ from topbid.orderbook import OrderBook
 @pytest.fixture(name="vai_prices")
 def fixture_vai_prices():
     """Kucoin VAI/USDT sample mocked orderbook"""
-    return [
-        {
-            "code": "200000",
-            "data": {
-                "time": 1675853445037,
-                "sequence": "47221666",
-                "bids": [["0.197007", "1300"], ["0.197", "202.6394"]],
-                "asks": [["0.197607", "1506.5178"], ["0.197608", "1300"]],
-            },
-        }
-    ]
+    return {
+        "code": "200000",
+        "data": {
+            "time": 1675853445037,
+            "sequence": "47221666",
+            "bids": [["0.197007", "1300"], ["0.197", "202.6394"]],
+            "asks": [["0.197607", "1506.5178"], ["0.197608", "1300"]],
+        },
+    }
 
 
 def test_init():
@@ -40,17 +37,27 @@ def test_get_orderbook_tops(vai_prices):
     orderbook = OrderBook()
     orderbook.add("kucoin", "VAI/USDT")
 
-    with patch("request_boost.boosted_requests") as boosted_mock:
-        boosted_mock.return_value = vai_prices
-        # start background update
-        orderbook.start(0.1)
-        time.sleep(0.2)
-    assert orderbook.orderbook_bids == {"kucoin-VAI/USDT": ("0.197007", "1300")}
-    assert orderbook.orderbook_asks == {"kucoin-VAI/USDT": ("0.197607", "1506.5178")}
+    responses.add(
+        responses.GET,
+        "https://api.kucoin.com/api/v1/market/orderbook/level2_5",
+        json=vai_prices,
+    )
+    # start background update
+    orderbook.start(0.1)
+    time.sleep(0.2)
+    assert orderbook.orderbook_bids == {("kucoin", "VAI/USDT"): (0.197007, 1300.0)}
+    assert orderbook.orderbook_asks == {("kucoin", "VAI/USDT"): (0.197607, 1506.5178)}
 
     # get_orderbook_top_bid
     top_bid = orderbook.get_orderbook_top_bid("kucoin", "VAI/USDT")
-    assert top_bid == ("0.197007", "1300")
+    assert top_bid == (0.197007, 1300.0)
+
+    # vectorized cross-pair analytics
+    assert orderbook.spreads()[("kucoin", "VAI/USDT")] == pytest.approx(0.0006)
+    assert orderbook.mid_prices()[("kucoin", "VAI/USDT")] == pytest.approx(0.197307)
+    best_id, best_price = orderbook.best_bid_across()
+    assert best_id == ("kucoin", "VAI/USDT")
+    assert best_price == pytest.approx(0.197007)
 
     # delete
     orderbook.delete("kucoin", "VAI/USDT")
@@ -60,13 +67,51 @@ def test_get_orderbook_tops(vai_prices):
     orderbook.stop()
 
 
+@responses.activate
+def test_binance_batched_update():
+    """OrderBook _update() batches Binance pairs into one bookTicker call"""
+    orderbook = OrderBook()
+    orderbook.add("binance", ["BTC/USDT", "ETH/USDT"])
+
+    responses.add(
+        responses.GET,
+        "https://api.binance.com/api/v3/ticker/bookTicker",
+        json=[
+            {
+                "symbol": "BTCUSDT",
+                "bidPrice": "23130.41",
+                "bidQty": "0.0584",
+                "askPrice": "23130.43",
+                "askQty": "0.0214",
+            },
+            {
+                "symbol": "ETHUSDT",
+                "bidPrice": "1633.12",
+                "bidQty": "1.2",
+                "askPrice": "1633.15",
+                "askQty": "0.8",
+            },
+        ],
+    )
+    # start background update
+    orderbook.start(0.1)
+    time.sleep(0.2)
+    # both pairs are collapsed into bookTicker calls, one per tick
+    assert responses.calls
+    assert all("bookTicker" in call.request.url for call in responses.calls)
+    assert orderbook.orderbook_bids[("binance", "BTC/USDT")] == (23130.41, 0.0584)
+    assert orderbook.orderbook_asks[("binance", "ETH/USDT")] == (1633.15, 0.8)
+
+    orderbook.stop()
+
+
 @responses.activate
 def test_get_orderbook_url():
     """OrderBook get_orderbook_url()"""
     orderbook = OrderBook()
     orderbook.add("kucoin", "VAI/USDT")
     orderbook_url = orderbook.get_orderbook_url("kucoin", "VAI/USDT")
-    url = "https://api.kucoin.com/api/v1/market/orderbook/level2_20?symbol=VAI-USDT"
+    url = "https://api.kucoin.com/api/v1/market/orderbook/level2_5?symbol=VAI-USDT"
     assert orderbook_url == url
 
 
@@ -0,0 +1,101 @@
+""" Tests for the OrderBookWS WebSocket class """
+
+import asyncio
+import threading
+import time
+
+import pytest
+import websockets
+
+import topbid.websocket
+from topbid.websocket import OrderBookWS
+
+BOOK_TICKER_FRAME = (
+    '{"stream":"btcusdt@bookTicker","data":{"s":"BTCUSDT",'
+    '"b":"23130.41","B":"0.0584","a":"23130.43","A":"0.0214"}}'
+)
+
+
+@pytest.fixture(name="ws_server")
+def fixture_ws_server(monkeypatch):
+    """
+    Local WebSocket server pushing one Binance bookTicker frame per
+    connection, with websockets.connect patched to land on it.
+    """
+    ready = threading.Event()
+    state = {}
+
+    async def handler(websocket):
+        await websocket.send(BOOK_TICKER_FRAME)
+        await asyncio.sleep(10)
+
+    async def main():
+        state["loop"] = asyncio.get_running_loop()
+        state["done"] = asyncio.Event()
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            state["port"] = server.sockets[0].getsockname()[1]
+            ready.set()
+            await state["done"].wait()
+
+    thread = threading.Thread(target=lambda: asyncio.run(main()), daemon=True)
+    thread.start()
+    assert ready.wait(timeout=5)
+
+    real_connect = websockets.connect
+
+    def local_connect(url, **kwargs):  # pylint: disable=unused-argument
+        return real_connect(f"ws://127.0.0.1:{state['port']}")
+
+    monkeypatch.setattr(topbid.websocket.websockets, "connect", local_connect)
+    yield
+    state["loop"].call_soon_threadsafe(state["done"].set)
+    thread.join(timeout=5)
+
+
+def wait_for_update(orderbook, _id, timeout=5.0):
+    """Waits until a pushed frame lands in the orderbook"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if orderbook.orderbook_bids.get(_id, (None, None)) != (None, None):
+            return
+        time.sleep(0.05)
+    raise AssertionError(f"no websocket update received for {_id}")
+
+
+@pytest.mark.usefixtures("ws_server")
+def test_websocket_stream():
+    """OrderBookWS start() feeds pushed frames into the orderbook"""
+    orderbook = OrderBookWS()
+    orderbook.add("binance", "BTC/USDT")
+    orderbook.start()
+
+    wait_for_update(orderbook, ("binance", "BTC/USDT"))
+    assert orderbook.orderbook_bids[("binance", "BTC/USDT")] == (23130.41, 0.0584)
+    assert orderbook.orderbook_asks[("binance", "BTC/USDT")] == (23130.43, 0.0214)
+    assert orderbook.get_orderbook_top_bid("binance", "BTC/USDT") == (23130.41, 0.0584)
+
+    orderbook.stop()
+
+
+@pytest.mark.usefixtures("ws_server")
+def test_websocket_stop_and_restart():
+    """OrderBookWS stop() is idempotent, resets caches and allows restart"""
+    orderbook = OrderBookWS()
+    orderbook.add("binance", "BTC/USDT")
+    orderbook.start()
+    wait_for_update(orderbook, ("binance", "BTC/USDT"))
+
+    orderbook.stop()
+    orderbook.stop()  # second call must be a no-op
+    assert orderbook.thread is None
+    assert not orderbook.orderbook_bids
+    assert not orderbook.orderbook_asks
+    assert not orderbook.mid_prices()
+
+    # restart after stop
+    orderbook.add("binance", "BTC/USDT")
+    orderbook.start()
+    wait_for_update(orderbook, ("binance", "BTC/USDT"))
+    assert orderbook.orderbook_bids[("binance", "BTC/USDT")] == (23130.41, 0.0584)
+
+    orderbook.stop()